@@ -1,16 +1,41 @@
 import logging
 # logging.basicConfig(level=logging.INFO)
 
-import pkg_resources
+import importlib
+# The backport provides files() on Python < 3.9, where the stdlib lacks it
+try:
+	import importlib_resources
+except ImportError:
+	import importlib.resources as importlib_resources
 
 from due.util.resources import ResourceManager
-from due.agent import Agent
-from due.episode import Episode
-from due.event import Event
-from due.action import Action
 
 resource_manager = ResourceManager()
-with pkg_resources.resource_stream(__name__, 'resource_index.yaml') as f:
-	resource_manager.register_yaml(f)
+try:
+	from due._resource_index import DATA as _RESOURCE_INDEX
+	resource_manager.register_index(_RESOURCE_INDEX)
+except ImportError:
+	with importlib_resources.files(__name__).joinpath('resource_index.yaml').open('rb') as f:
+		resource_manager.register_yaml(f)
 
 __version__ = '0.1.dev5'
+
+# Core classes are imported on first access (PEP 562), so that `import due`
+# does not pay for their dependencies until they are actually needed.
+_LAZY_ATTRIBUTES = {
+	'Agent': 'due.agent',
+	'Episode': 'due.episode',
+	'Event': 'due.event',
+	'Action': 'due.action',
+}
+
+def __getattr__(name):
+	if name in _LAZY_ATTRIBUTES:
+		module = importlib.import_module(_LAZY_ATTRIBUTES[name])
+		result = getattr(module, name)
+		globals()[name] = result
+		return result
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+	return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,28 @@
+"""
+Precompiled copy of `resource_index.yaml`, loaded in `due.__init__` so that no
+YAML parsing happens at import time. Keep the two files in sync: the YAML index
+remains the source of truth, and is used as a fallback if this module is missing.
+"""
+
+DATA = {
+	'resources': [
+		{
+			'name': 'corpora.cornell',
+			'description': 'the Cornell Movie-Dialogs Corpus (http://www.cs.cornell.edu/~cristian/Cornell_Movie-Dialogs_Corpus.html)',
+			'url': 'http://www.cs.cornell.edu/~cristian/data/cornell_movie_dialogs_corpus.zip',
+			'filename': 'cornell_movie_dialogs_corpus.zip',
+		},
+		{
+			'name': 'corpora.tv.friends',
+			'description': 'Friends TV show corpus (https://sites.google.com/site/friendstvcorpus/) by David Ayliffe',
+			'url': 'https://sites.google.com/site/friendstvcorpus/files/Data.zip?attredirects=0&d=1',
+			'filename': 'friends_corpus.zip',
+		},
+		{
+			'name': 'embeddings.glove6B',
+			'description': 'Global Vectors for Word Representation (https://nlp.stanford.edu/projects/glove/); 6B tokens (Wikipedia 2014 + Gigaword 5)',
+			'url': 'http://nlp.stanford.edu/data/glove.6B.zip',
+			'filename': 'glove.6B.zip',
+		},
+	]
+}
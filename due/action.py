@@ -1,26 +1,35 @@
-from abc import ABCMeta, abstractmethod, abstractproperty
-from due.util.python import full_class_name, dynamic_import
+from due.util.python import full_class_name, cached_dynamic_import
 
 #
 # Action Interface
 #
 
-class Action(metaclass=ABCMeta):
+class Action():
 	"""
 	An Action is an Event in an Episode that allows the run of arbitrary Python
 	code.
 
 	This is achieved extending this `Action` interface with the proper implementation
-	of the `run` method.
+	of the `run` method. Subclasses should declare their attributes in `__slots__`,
+	as Actions may be instantiated in large numbers when loading Episodes.
 	"""
 
-	@abstractmethod
+	__slots__ = ()
+
+	# Action subclasses by full class name, populated as they are defined
+	_registry = {}
+
+	def __init_subclass__(cls, **kwargs):
+		super().__init_subclass__(**kwargs)
+		cls._full_name = full_class_name(cls)
+		Action._registry[cls._full_name] = cls
+
 	def run(self):
 		"""
 		This method will be invoked when the Agent issues the Action in a
-		conversation
+		conversation. Subclasses must implement their own.
 		"""
-		pass
+		raise NotImplementedError()
 
 	def save(self):
 		"""
@@ -29,7 +38,7 @@ class Action(metaclass=ABCMeta):
 		:return: the serialized Action
 		:rtype: `dict`
 		"""
-		return {'class': full_class_name(self.__class__), 'data': None}
+		return {'class': self._full_name, 'data': None}
 
 	@staticmethod
 	def load(saved_action):
@@ -41,9 +50,12 @@ class Action(metaclass=ABCMeta):
 		:return: an `Action` object
 		:rtype: :class:`due.action.Action`
 		"""
-		class_ = dynamic_import(saved_action['class'])
+		class_name = saved_action['class']
+		class_ = Action._registry.get(class_name) or cached_dynamic_import(class_name)
 		return class_(saved_action['data'])
 
+Action._full_name = full_class_name(Action)
+
 #
 # Example Actions
 #
@@ -60,6 +72,8 @@ class RecordedAction(Action):
 	:type data: `dict`
 	"""
 
+	__slots__ = ('done',)
+
 	def __init__(self, data=None):
 		self.done = data['done'] if data else False
 
@@ -72,7 +86,7 @@ class RecordedAction(Action):
 
 	def save(self):
 		"""See :func:`due.action.Action.save`"""
-		return {'class': full_class_name(self.__class__), 'data': {'done': self.done}}
+		return {'class': self._full_name, 'data': {'done': self.done}}
 
 	def __eq__(self, other):
 		return self.done == other.done
@@ -82,6 +96,8 @@ class ExampleAction(Action):
 	An example action that creates a file in your home directory.
 	"""
 
+	__slots__ = ()
+
 	FILENAME = "DUE_EXAMPLE_ACTION"
 	CONTENT = "Due was here..."
 
@@ -92,7 +108,5 @@ class ExampleAction(Action):
 		"""
 		home = os.path.expanduser("~")
 		with open(os.path.join(home, ExampleAction.FILENAME), "w") as f:
-			f.write(str(datetime.now()))
-			f.write("\n")
-			f.write(ExampleAction.CONTENT)
+			f.write(f"{datetime.now()}\n{ExampleAction.CONTENT}")
 		return True
@@ -4,14 +4,18 @@ entities that can take part in Episodes (:mod:`due.episode`), receiving and
 issuing Events (:mod:`due.event`).
 """
 import uuid
-from abc import ABCMeta, abstractmethod
+import asyncio
 from datetime import datetime
 
 from due.event import Event
-from due import episode
-from due.util.python import dynamic_import
+from due.util.python import full_class_name, cached_dynamic_import
 
-class Agent(metaclass=ABCMeta):
+# Event types, bound once to spare attribute lookups when acting Events
+_UTTERANCE = Event.Type.Utterance
+_ACTION = Event.Type.Action
+_LEAVE = Event.Type.Leave
+
+class Agent():
 	"""
 	Participants in an Episodes are called Agents. An Agent models an unique
 	identity through its ID, and can be served on a number of channels using
@@ -22,16 +26,35 @@ class Agent(metaclass=ABCMeta):
 	conversational experience; they are meant to learn from Episodes coming from
 	a corpus, as well as from live conversations with humans or other agents.
 
+	Subclasses must implement every method that raises `NotImplementedError` in
+	this base class. Agents declare their attributes in `__slots__`; subclasses
+	that do not will simply get a per-instance `__dict__`.
+
 	:param agent_id: an unique ID for the Agent
 	:type agent_id: `str`
 	:param name: a human-friendly name for the Agent
 	:type name: `str`
 	"""
 
+	__slots__ = ('id', '__weakref__')
+
+	# Name of the handler method for each Event type (see :meth:`event_callback`)
+	_EVENT_CALLBACKS = {
+		_UTTERANCE: 'utterance_callback',
+		_ACTION: 'action_callback',
+		_LEAVE: 'leave_callback',
+	}
+
+	# Agent subclasses by full class name, populated as they are defined
+	_registry = {}
+
+	def __init_subclass__(cls, **kwargs):
+		super().__init_subclass__(**kwargs)
+		Agent._registry[full_class_name(cls)] = cls
+
 	def __init__(self, agent_id=None):
-		self.id = agent_id if agent_id is not None else str(uuid.uuid1())
+		self.id = agent_id if agent_id is not None else uuid.uuid4().hex
 
-	@abstractmethod
 	def save(self):
 		"""
 		Returns the Agent as an object. This object can be loaded with
@@ -47,7 +70,7 @@ class Agent(metaclass=ABCMeta):
 		:return: an object representing the Agent
 		:rtype: object
 		"""
-		pass
+		raise NotImplementedError()
 
 	@staticmethod
 	def load(saved_agent):
@@ -60,10 +83,10 @@ class Agent(metaclass=ABCMeta):
 		:return: an Agent
 		:rtype: `due.agent.Agent`
 		"""
-		class_ = dynamic_import(saved_agent['class'])
+		class_name = saved_agent['class']
+		class_ = Agent._registry.get(class_name) or cached_dynamic_import(class_name)
 		return class_(_data=saved_agent['data'])
 
-	@abstractmethod
 	def learn_episodes(self, episodes):
 		"""
 		Submit a list of Episodes for the :class:`Agent` to learn.
@@ -71,7 +94,7 @@ class Agent(metaclass=ABCMeta):
 		:param episodes: a list of episodes
 		:type episodes: `list` of :class:`due.episode.Episode`
 		"""
-		pass
+		raise NotImplementedError()
 
 	def learn_episode(self, episode):
 		"""
@@ -83,7 +106,6 @@ class Agent(metaclass=ABCMeta):
 		"""
 		self.learn_episodes([episode])
 
-	@abstractmethod
 	def new_episode_callback(self, new_episode):
 		"""
 		This is a callback method that is invoked whenever the Agent is invited
@@ -95,7 +117,7 @@ class Agent(metaclass=ABCMeta):
 		:param new_episode: the new Episode that the other Agent has created
 		:type new_episode: :class:`due.episode.Episode`
 		"""
-		pass
+		raise NotImplementedError()
 
 	def start_episode(self, other):
 		"""
@@ -107,7 +129,8 @@ class Agent(metaclass=ABCMeta):
 		:return: a new Episode object
 		:rtype: :class:`due.episode.LiveEpisode`
 		"""
-		result = episode.LiveEpisode(self, other)
+		from due.episode import LiveEpisode
+		result = LiveEpisode(self, other)
 		other.new_episode_callback(result)
 		return result
 
@@ -128,19 +151,24 @@ class Agent(metaclass=ABCMeta):
 		:return: A list of response Events
 		:rtype: `list` of :class:`due.event.Event`
 		"""
-		if event.type == Event.Type.Utterance:
-			result = self.utterance_callback(episode)
-		elif event.type == Event.Type.Action:
-			result = self.action_callback(episode)
-		elif event.type == Event.Type.Leave:
-			result = self.leave_callback(episode)
+		return getattr(self, self._EVENT_CALLBACKS[event.type])(episode) or []
 
-		if not result:
-			result = []
-		
-		return result
+	async def event_callback_async(self, event, episode):
+		"""
+		Asynchronous counterpart of :meth:`event_callback`, to be awaited in an
+		event loop. By default this just calls :meth:`event_callback`: Agents
+		whose callbacks wait on I/O (eg. a remote model) can override it so
+		that other Episodes are served in the meantime.
+
+		:param event: The new Event
+		:type event: :class:`due.event.Event`
+		:param episode: The Episode where the Event was acted
+		:type episode: :class:`due.episode.Episode`
+		:return: A list of response Events
+		:rtype: `list` of :class:`due.event.Event`
+		"""
+		return self.event_callback(event, episode)
 
-	@abstractmethod
 	def utterance_callback(self, episode):
 		"""
 		This is a callback method that is invoked whenever a new Utterance
@@ -151,9 +179,8 @@ class Agent(metaclass=ABCMeta):
 		:return: A list of response Events
 		:rtype: `list` of :class:`due.event.Event`
 		"""
-		pass
+		raise NotImplementedError()
 
-	@abstractmethod
 	def action_callback(self, episode):
 		"""
 		This is a callback method that is invoked whenever a new Action Event
@@ -164,9 +191,8 @@ class Agent(metaclass=ABCMeta):
 		:return: A list of response Events
 		:rtype: `list` of :class:`due.event.Event`
 		"""
-		pass
+		raise NotImplementedError()
 
-	@abstractmethod
 	def leave_callback(self, episode):
 		"""
 		This is a callback method that is invoked whenever a new Leave Event is
@@ -177,11 +203,13 @@ class Agent(metaclass=ABCMeta):
 		:return: A list of response Events
 		:rtype: `list` of :class:`due.event.Event`
 		"""
-		pass
+		raise NotImplementedError()
 
 	def act_events(self, events, episode):
 		"""
-		Act a sequence of Events in the given Episode.
+		Act a sequence of Events in the given Episode. Actions are run first,
+		then the whole sequence is added to the Episode at once (see
+		:meth:`due.episode.LiveEpisode.add_events`).
 
 		:param events: a list of Events
 		:type events: `list` of :class:`due.event.Event`
@@ -189,47 +217,71 @@ class Agent(metaclass=ABCMeta):
 		:type episode: :class:`due.episode.Episode`
 		"""
 		for e in events:
-			if e.type == Event.Type.Action:
+			if e.type is _ACTION:
 				e.payload.run()
 
-			episode.add_event(e)
+		episode.add_events(events)
 
-	def say(self, sentence, episode):
+	async def act_events_async(self, events, episode):
+		"""
+		Asynchronous counterpart of :meth:`act_events`. The Actions in `events`
+		are run concurrently in the event loop's default executor, then the
+		whole sequence is added to the Episode.
+
+		:param events: a list of Events
+		:type events: `list` of :class:`due.event.Event`
+		:param episode: an Episode
+		:type episode: :class:`due.episode.Episode`
+		"""
+		loop = asyncio.get_running_loop()
+		actions = [e.payload for e in events if e.type is _ACTION]
+		if actions:
+			await asyncio.gather(*[loop.run_in_executor(None, a.run) for a in actions])
+
+		episode.add_events(events)
+
+	def say(self, sentence, episode, timestamp=None):
 		"""
 		Create an Event out of the given sentence and act the new Event in
 		the given Episode. :class:`Agent` subclassed may need to extend this
 		implementation with some output operation (eg. print on screen,
 		broadcast to a jabber chat...).
 
+		If no timestamp is given, the current timestamp is used. Passing one
+		is useful when replaying many events, as it saves a clock read each.
+
 		:param sentence: A sentence
 		:type sentence: :class:`str`
 		:param episode: An Episode
 		:type episode: :class:`due.episode.Episode`
+		:param timestamp: timestamp of the new Event
+		:type timestamp: `datetime`
 		"""
-		utterance_event = Event(Event.Type.Utterance, datetime.now(), self.id, sentence)
-		episode.add_event(utterance_event)
+		episode.add_event(Event(_UTTERANCE, timestamp or datetime.now(), self.id, sentence))
 
-	def do(self, action, episode):
+	def do(self, action, episode, timestamp=None):
 		"""
 		Create an Event out of the given Action and acts the new Event in the
 		given Episode.
 
 		:param action: An Action
 		:type action: :class:`due.action.Action`
+		:param timestamp: timestamp of the new Event (see :meth:`say`)
+		:type timestamp: `datetime`
 		"""
 		action.run()
-		action_event = Event(Event.Type.Action, datetime.now(), self.id, action)
-		episode.add_event(action_event)
+		episode.add_event(Event(_ACTION, timestamp or datetime.now(), self.id, action))
 
-	def leave(self, episode):
+	def leave(self, episode, timestamp=None):
 		"""
 		Acts a new Leave Event in the given Episode.
 
 		:param episode: One of the Agent's active episodes
 		:type episode: :class:`due.episode.Episode`
+		:param timestamp: timestamp of the new Event (see :meth:`say`)
+		:type timestamp: `datetime`
 		"""
-		leave_event = Event(Event.Type.Leave, datetime.now(), self.id, None)
-		episode.add_event(leave_event)
+		episode.add_event(Event(_LEAVE, timestamp or datetime.now(), self.id, None))
 
 	def __str__(self):
 		return f"<Agent: {self.id}>"
@@ -14,8 +14,6 @@ corpus may start in the middle of a longer conversation, and may end before \
 that conversation is finished.
 """
 
-import re
-import ast
 from datetime import datetime, timedelta
 
 import pandas as pd
@@ -27,12 +25,14 @@ else:
 	import tqdm
 
 from due.episode import Episode
-from due.event import Event
+from due.event import Event, EventTuple
 from due import resource_manager
 
 rm = resource_manager
 
 START_DATE = datetime(2011, 6, 15, 12, 0)
+DELTA = timedelta(seconds=1)
+SEPARATOR = ' +++$+++ '
 
 def load():
 	return list(episodes())
@@ -47,22 +47,22 @@ def episodes():
 	:return: The Cornell Movie-Dialog Corpus
 	:rtype: `list` of :class:`due.episode.Episode`
 	"""
-	global current_date
-
 	with _open_cornell('movie_conversations.txt') as f:
 		df_conversations = _read_cornell(f, ['character_id_A', 'character_id_B', 'movie_id', 'utterance_list'])
-		df_conversations['utterance_list'] = df_conversations['utterance_list'].apply(ast.literal_eval)
+		# Lists are serialized as "['L194', 'L195']"; line IDs contain no quotes nor commas
+		df_conversations['utterance_list'] = df_conversations['utterance_list'].str.strip('[]').str.replace("'", '', regex=False).str.split(', ')
 
 	# with _open_cornell('movie_characters_metadata.txt') as f:
 	# 	df_characters = _read_cornell(f, ['character_id', 'character_name', 'movie_id', 'movie_title', 'gender', 'credits_position'])
 
 	with _open_cornell('movie_lines.txt') as f:
 		df_lines = _read_cornell(f, ['line_id', 'character_id', 'movie_id', 'character_name', 'utterance'])
-		df_lines.set_index('line_id', inplace=True)
+	lines = dict(zip(df_lines['line_id'], zip(df_lines['character_id'], df_lines['utterance'])))
 
-	current_date = START_DATE
+	n_events = int(df_conversations['utterance_list'].str.len().sum())
+	timestamps = iter(pd.date_range(START_DATE, periods=n_events, freq=DELTA).to_pydatetime())
 	for conversation in tqdm(df_conversations.itertuples(), total=len(df_conversations)):
-		events = [_build_event(l_id, df_lines) for l_id in conversation.utterance_list]
+		events = [_build_event(l_id, lines, next(timestamps)) for l_id in conversation.utterance_list]
 		episode = _build_episode(conversation, events)
 		yield episode
 
@@ -76,15 +76,11 @@ def _open_cornell(filename):
 	return rm.open_resource_file('corpora.cornell', filename_full, binary=False, encoding='iso-8859-1')
 
 def _read_cornell(file_buffer, columns):
-	return pd.read_csv(file_buffer, sep=re.escape(' +++$+++ '), names=columns, engine='python')
-
-current_date = START_DATE
-def _build_event(line_id, df_lines):
-	global current_date
-	line = df_lines.loc[line_id]
-	result = Event(Event.Type.Utterance, current_date, line.character_id, line.utterance)
-	current_date += timedelta(seconds=1)
-	return result
+	return pd.DataFrame([line.rstrip('\n').split(SEPARATOR) for line in file_buffer], columns=columns)
+
+def _build_event(line_id, lines, timestamp):
+	character_id, utterance = lines[line_id]
+	return EventTuple(Event.Type.Utterance, timestamp, character_id, utterance)
 
 def _build_episode(conversation, events):
 	agents = set([conversation.character_id_A, conversation.character_id_B])
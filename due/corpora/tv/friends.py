@@ -8,6 +8,7 @@ Conversations are grouped in **scenes** and each scene is given a brief English
 description (which is currently not modelled in Episodes).
 """
 import logging
+from itertools import repeat
 from datetime import datetime, timedelta
 
 import pandas as pd
@@ -30,45 +31,38 @@ def episodes():
         df = pd.read_csv(f, sep='\t', header=None, index_col=0)
 
     df.columns = ["scene_id", "person", "gender", "original_line", "line", "metadata", "filename"]
-    scenes = [int(x) for x in set(df['scene_id']) if x.isdigit()]
-    scenes.sort(key=lambda x: int(x))
+    df = df[df['scene_id'].astype(str).str.isdigit()]
+    scenes = df.groupby(df['scene_id'].astype(int), sort=True)
 
-    for i, scene_id in enumerate(scenes):
+    for i, (_, scene_df) in enumerate(scenes):
         try:
-            scene_df = df[df['scene_id'] == str(scene_id)]
             episode = build_episode(scene_df)
             yield episode
         except Exception as e:
             logger.warning("Skipping scene %s because of exception: %s", i, e)
 
-def _get_events_dataframe(df):
-    df_events = df[['person', 'line']]
-    df_events.columns = ['agent', 'payload']
-    timestamp_series = pd.Series(pd.date_range(start=START_DATE, periods=len(df_events), freq=DELTA), index=df_events.index, name='timestamp')    
-    df_events = df_events.join(pd.DataFrame(timestamp_series))
-    df_events['type'] = Event.Type.Utterance
-    df_events = df_events[['type', 'timestamp', 'agent', 'payload']]
-    return df_events
-
 def build_episode(df):
     """
-    Build an Episode out of a Pandas DataFrame of events. The input DataFrame
-    must match the fields of an Event tuple:
+    Build an Episode out of a Pandas DataFrame of lines from the corpus. Each
+    row becomes an utterance Event: the input DataFrame must have the following
+    columns:
+
+    * `person`: the agent uttering the line
+    * `line`: the utterance payload
+
+    Events are placed :data:`DELTA` apart one another, starting from
+    :data:`START_DATE`.
 
-    * `type`
-    * `timestamp`
-    * `agent`
-    * `payload`
-    
-    :param df: A Pandas DataFrame representing events
+    :param df: A Pandas DataFrame of corpus lines
     :type df: :class:`pandas.DataFrame`
     :return: An Episode containing the given events
     :rtype: :class:`due.episode.Episode`
     """
-    df_events = _get_events_dataframe(df)
-    agents = set(df_events['agent'])
-    starter_agent = df_events.iloc[0].agent
-    invited_agent = (agents - set([starter_agent])).pop() # TODO: multiple agents!
+    n_events = len(df)
+    agents = df['person'].tolist()
+    timestamps = pd.date_range(start=START_DATE, periods=n_events, freq=DELTA)
+    starter_agent = agents[0]
+    invited_agent = (set(agents) - set([starter_agent])).pop() # TODO: multiple agents!
     result = Episode(starter_agent, invited_agent)
-    result.events = [EventTuple(*e[1:]) for e in df_events.itertuples(name=None)]
+    result.events = list(map(EventTuple, repeat(Event.Type.Utterance, n_events), timestamps, agents, df['line'].tolist()))
     return result
@@ -10,15 +10,20 @@ API
 ===
 """
 import io
+import csv
 import json
 import uuid
 import asyncio
 import logging
 from functools import lru_cache
 from datetime import datetime
+from itertools import islice
+from collections import deque
 
-import numpy as np
-import pandas as pd
+try:
+	import orjson
+except ImportError:
+	orjson = None
 
 import due.agent
 from due.util.time import convert_datetime, parse_timedelta
@@ -26,32 +31,38 @@ from due.util.time import convert_datetime, parse_timedelta
 UTTERANCE_LABEL = 'utterance'
 MAX_EVENT_RESPONSES = 200
 
+_COMPACT_EVENT_FIELDS = ['type', 'timestamp', 'agent', 'payload']
+
 class Episode(object):
 	"""
 	An Episode is a sequence of Events issued by Agents
 	"""
 
+	__slots__ = ('starter_id', 'invited_id', 'id', 'timestamp', 'events', '__weakref__')
+
+	_logger = logging.getLogger(__name__ + ".Episode")
+
 	def __init__(self, starter_agent_id, invited_agent_id):
-		self._logger = logging.getLogger(__name__ + ".Episode")
 		self.starter_id = starter_agent_id
 		self.invited_id = invited_agent_id
-		self.id = str(uuid.uuid1())
+		self.id = uuid.uuid4().hex
 		self.timestamp = datetime.now()
 		self.events = []
 
 	def __eq__(self, other):
-		if isinstance(other, Episode):
-			if self.starter_id != other.starter_id: return False
-			if self.invited_id != other.invited_id: return False
-			if self.id != other.id: return False
-			if self.timestamp != other.timestamp: return False
-			if self.events != other.events: return False
+		if other is self:
 			return True
-
-		return False
-
-	def __ne__(self, other):
-		return not self.__eq__(other)
+		if not isinstance(other, Episode):
+			return NotImplemented
+		# Cheapest and most discriminating fields first, events last
+		return self.id == other.id \
+			and self.starter_id == other.starter_id \
+			and self.invited_id == other.invited_id \
+			and self.timestamp == other.timestamp \
+			and self.events == other.events
+
+	def __hash__(self):
+		return hash(self.id)
 
 	def last_event(self, event_type=None):
 		"""
@@ -61,9 +72,17 @@ class Episode(object):
 		:param event_type: an event type, or a collection of types
 		:type event_type: :class:`Event.Type` or list of :class:`Event.Type`
 		"""
-		event_type = event_type if not isinstance(event_type, Event.Type) else (event_type,)
+		if event_type is None:
+			return self.events[-1] if self.events else None
+
+		if isinstance(event_type, Event.Type):
+			for e in reversed(self.events):
+				if e.type is event_type:
+					return e
+			return None
+
 		for e in reversed(self.events):
-			if event_type is None or e.type in event_type:
+			if e.type in event_type:
 				return e
 		return None
 
@@ -89,7 +108,7 @@ class Episode(object):
 			'timestamp': self.timestamp,
 			'starter_agent': str(self.starter_id),
 			'invited_agents': [str(self.invited_id)],
-			'events': [e.save() for e in self.events],
+			'events': [_save_event(e) for e in self.events],
 			'format': 'standard'
 		}
 
@@ -127,15 +146,22 @@ class LiveEpisode(Episode):
 	:param invited_agent: the agent invited to the Episode
 	:type invited_agent: :class:`due.agent.Agent`
 	"""
+	__slots__ = ('starter', 'invited', '_agent_by_id', '_other_agents_by_id')
+
+	_logger = logging.getLogger(__name__ + ".LiveEpisode")
+
 	def __init__(self, starter_agent, invited_agent):
 		super().__init__(starter_agent.id, invited_agent.id)
-		self._logger = logging.getLogger(__name__ + ".LiveEpisode")
 		self.starter = starter_agent
 		self.invited = invited_agent
 		self._agent_by_id = {
 			starter_agent.id: starter_agent,
 			invited_agent.id: invited_agent
 		}
+		self._other_agents_by_id = {
+			starter_agent.id: (invited_agent,),
+			invited_agent.id: (starter_agent,)
+		}
 
 	def add_event(self, event):
 		"""
@@ -144,32 +170,55 @@ class LiveEpisode(Episode):
 		Response Events that are returned from the callback which will be
 		processed iteratively.
 
-		:param agent: the agent which acted the Event
-		:type agent: :class:`due.agent.Agent`
+		This is a shortcut for :meth:`add_events` with a single Event.
+
 		:param event: the event that was acted by the Agent
 		:type event: :class:`due.event.Event`
 		"""
-		new_events = [event]
+		self.add_events([event])
 
-		count = 0
-		while new_events:
-			e = new_events.pop(0)
-			self._logger.info("New %s event by %s: '%s'", e.type.name, e.agent, e.payload)
-			agent = self.agent_by_id(e.agent)
-			self.events.append(e)
-			e.mark_acted()
-			for a in self._other_agents(agent):
-				self._logger.info("Notifying %s", a)
-				response_events = a.event_callback(e, self)
-				new_events.extend(response_events)
+	def add_events(self, events):
+		"""
+		Adds a sequence of Events to the LiveEpisode. This is equivalent to
+		calling :meth:`add_event` on each Event in turn: every Event is
+		notified to the other participants, and its responses processed,
+		before the next one is added.
 
-			count += 1
-			if count > MAX_EVENT_RESPONSES:
-				self._logger.warning("Agents reached maximum number of responses allowed for a single Event (%s). Further Events won't be notified to Agents", MAX_EVENT_RESPONSES)
-				break
+		Both :meth:`add_event` and :meth:`due.agent.Agent.act_events` go
+		through this method: subclasses that need to intercept new Events
+		should override this one.
 
-		self.events.extend(new_events)
-		[e.mark_acted() for e in new_events]
+		:param events: the events that were acted by the Agent
+		:type events: `list` of :class:`due.event.Event`
+		"""
+		log_info = self._logger.isEnabledFor(logging.INFO)
+		for event in events:
+			new_events = deque([event])
+			count = 0
+			while new_events:
+				e = new_events.popleft()
+				self.events.append(e)
+				e.mark_acted()
+				new_events.extend(self._notify_other_agents(e, log_info))
+
+				count += 1
+				if count > MAX_EVENT_RESPONSES:
+					self._logger.warning("Agents reached maximum number of responses allowed for a single Event (%s). Further Events won't be notified to Agents", MAX_EVENT_RESPONSES)
+					break
+
+			self.events.extend(new_events)
+			for e in new_events:
+				e.mark_acted()
+
+	def _notify_other_agents(self, event, log_info):
+		if log_info:
+			self._logger.info("New %s event by %s: '%s'", event.type.name, event.agent, event.payload)
+		result = []
+		for a in self._other_agents(self.agent_by_id(event.agent)):
+			if log_info:
+				self._logger.info("Notifying %s", a)
+			result.extend(a.event_callback(event, self))
+		return result
 
 	def agent_by_id(self, agent_id):
 		"""
@@ -188,7 +237,7 @@ class LiveEpisode(Episode):
 		return result
 
 	def _other_agents(self, agent):
-		return [self.starter] if agent == self.invited else [self.invited]
+		return self._other_agents_by_id[agent.id]
 
 class AsyncLiveEpisode(LiveEpisode):
 	"""
@@ -196,35 +245,55 @@ class AsyncLiveEpisode(LiveEpisode):
 	notification of new Events.
 	"""
 
-	def add_event(self, event):
-		self.events.append(event)
-		event.mark_acted()
-		agent = self.agent_by_id(event.agent)
-		for a in self._other_agents(agent):
-			loop = asyncio.get_event_loop()
-			loop.create_task(self.async_event_callback(a, event))
+	__slots__ = ()
+
+	def add_events(self, events):
+		events = list(events)
+		self.events.extend(events)
+		for e in events:
+			e.mark_acted()
+
+		loop = asyncio.get_event_loop()
+		for e in events:
+			agent = self.agent_by_id(e.agent)
+			loop.create_task(self._notify_agents(self._other_agents(agent), e))
+
+	async def _notify_agents(self, agents, event):
+		await asyncio.gather(*[self.async_event_callback(a, event) for a in agents])
 
 	async def async_event_callback(self, agent, event):
-		self._logger.info("Notifying event %s to agent %s", event, agent)
-		response_events = agent.event_callback(event, self)
+		if self._logger.isEnabledFor(logging.INFO):
+			self._logger.info("Notifying event %s to agent %s", event, agent)
+		response_events = await agent.event_callback_async(event, self)
 		if response_events:
-			for e in response_events:
-				self.add_event(e)
+			self.add_events(response_events)
 
 #
 # Save/Load Helpers
 #
 
+def _save_event(event):
+	"""
+	Save an Event of the Episode. Corpus loaders may fill episodes with plain
+	:data:`due.event.EventTuple` objects, which are converted to an Event first.
+	"""
+	if isinstance(event, Event):
+		return event.save()
+	return Event(*event).save()
+
 def _compact_saved_episode(saved_episode):
 	"""
 	Convert a saved episode into a compact representation.
 	"""
-	events = saved_episode['events']
-	events = [_compact_saved_event(e) for e in events]
-	df = pd.DataFrame(events)
-	s = io.StringIO()
-	df.to_csv(s, sep='|', header=False, index=False)
-	compact_events = [l for l in s.getvalue().split('\n') if l]
+	buf = io.StringIO()
+	writer = csv.writer(buf, delimiter='|', lineterminator='')
+	compact_events = []
+	for e in saved_episode['events']:
+		e = _compact_saved_event(e)
+		writer.writerow([e[f] for f in _COMPACT_EVENT_FIELDS])
+		compact_events.append(buf.getvalue())
+		buf.seek(0)
+		buf.truncate()
 	return {**saved_episode, 'events': compact_events, 'format': 'compact'}
 
 def _compact_saved_event(saved_event):
@@ -234,37 +303,48 @@ def _compact_saved_event(saved_event):
 	which payloads are objects. In this case, we serialize them as JSON.
 	"""
 	e = saved_event
-	if e['type'] == Event.Type.Action.value:
-		return {**e, 'payload': json.dumps(e['payload'])}
+	if e['type'] == _ACTION_VALUE:
+		payload = orjson.dumps(e['payload']).decode() if orjson else json.dumps(e['payload'])
+		return {**e, 'payload': payload}
 	return e
 
 def _uncompact_saved_episode(compact_episode):
 	"""
 	Convert a compacted saved episode back to the standard format.
 	"""
-	buf = io.StringIO('\n'.join(compact_episode['events']))
-	df = pd.read_csv(buf, sep='|', names=['type', 'timestamp', 'agent', 'payload'])
-	compact_events = df.replace({np.nan:None}).to_dict(orient='records')
+	reader = csv.reader(io.StringIO('\n'.join(compact_episode['events'])), delimiter='|')
 	events = []
 	last_timestamp = convert_datetime(compact_episode['timestamp'])
-	for e in compact_events:
-		e_new = _uncompact_saved_event(e, last_timestamp)
+	for row in reader:
+		e_new = _uncompact_saved_event(_compact_row_to_dict(row), last_timestamp)
 		events.append(e_new)
 		last_timestamp = e_new['timestamp']
 	return {**compact_episode, 'events': events, 'format': 'standard'}
 
+def _compact_row_to_dict(row):
+	"""
+	Map the fields of a compact CSV line to a saved Event `dict`. Empty or
+	missing fields are `None`, and unquoted `|` characters are kept in the
+	payload.
+	"""
+	n_fields = len(_COMPACT_EVENT_FIELDS)
+	if len(row) > n_fields:
+		row = row[:n_fields-1] + ['|'.join(row[n_fields-1:])]
+	values = [v if v != '' else None for v in row]
+	values += [None] * (n_fields - len(values))
+	return dict(zip(_COMPACT_EVENT_FIELDS, values))
+
 def _uncompact_saved_event(compact_event, last_timestamp):
 	"""
 	Note that `compact_event` is not the CSV line. It is already its dict
-	representation, but Action payloads need to be deserialized from JSON.
-	Also, the Pandas interpretation of CSV needs to be fixed, by converting
-	timestamps to `datetime`, and converting NaN values to `None`.
+	representation, but Action payloads need to be deserialized from JSON,
+	and timestamps converted to `datetime`.
 	"""
 	e = compact_event
 	timestamp = _uncompact_timestamp(compact_event, last_timestamp)
 	e = {**e, 'timestamp': timestamp}
-	if compact_event['type'] == Event.Type.Action.value:
-		e['payload'] = json.loads(e['payload'])
+	if compact_event['type'] == _ACTION_VALUE:
+		e['payload'] = orjson.loads(e['payload']) if orjson else json.loads(e['payload'])
 	return e
 
 
@@ -272,21 +352,19 @@ def _uncompact_timestamp(compact_event, last_timestamp):
 	"""
 	In compacted episodes the timestamp can be a ISO string, or as a time
 	difference from the previous event; in this latter case, the delta must be
-	expressed as a int (number of seconds) or in the `1d2h3m4s` format (see
+	expressed as a number of seconds or in the `1d2h3m4s` format (see
 	:func:`due.util.time.parse_timedelta`).
 	"""
-	try:
-		return convert_datetime(compact_event['timestamp'])
-	except ValueError:
-		return last_timestamp + parse_timedelta(compact_event['timestamp'])
+	timestamp = compact_event['timestamp'].strip()
+	# ISO strings always end with a digit, and are never all digits
+	if timestamp.isdigit() or timestamp[-1:] in ('d', 'h', 'm', 's'):
+		return last_timestamp + parse_timedelta(timestamp)
+	return convert_datetime(timestamp)
 
 #
 # Utilities
 #
 
-def _is_utterance(event):
-	return event.type == Event.Type.Utterance
-
 def extract_utterances(episode, preprocess_f=None, keep_holes=False):
 	"""
 	Return all the utterances in an Episode as strings. If the `keep_holes`
@@ -304,14 +382,9 @@ def extract_utterances(episode, preprocess_f=None, keep_holes=False):
 	if not preprocess_f:
 		preprocess_f = lambda x: x
 
-	result = []
-	for e in episode.events:
-		if e.type == Event.Type.Utterance:
-			result.append(preprocess_f(e.payload))
-		elif keep_holes:
-			result.append(None)
-
-	return result
+	if keep_holes:
+		return [preprocess_f(e.payload) if e.type is _UTTERANCE else None for e in episode.events]
+	return [preprocess_f(e.payload) for e in episode.events if e.type is _UTTERANCE]
 
 def extract_utterance_pairs(episode, preprocess_f=None):
 	"""
@@ -329,9 +402,10 @@ def extract_utterance_pairs(episode, preprocess_f=None):
 	one will be included in the result.
 
 	If a `preprocess_f` function is specified, resulting utterances will be run
-	through this function before being returned. A LRU Cache is applied to
-	`preprocess_f`, as most sentences will be returned as both utterances and
-	answers/
+	through this function before being returned. `preprocess_f` is called once
+	per distinct sentence in the Episode, as most sentences will be returned as
+	both utterances and answers: it must be a deterministic function of its
+	input.
 
 	Return two lists of the same length, so that each utterance `X_i` in the
 	first list has its response `y_i` in the second.
@@ -343,18 +417,21 @@ def extract_utterance_pairs(episode, preprocess_f=None):
 	:return: a list of utterances and the list of their answers (one per utterance)
 	:rtype: (`list`, `list`)
 	"""
-	preprocess_f = lru_cache(4)(preprocess_f) if preprocess_f else lambda x: x
-	result_X = []
-	result_y = []
-	for e1, e2 in zip(episode.events, episode.events[1:]):
-		if not _is_utterance(e1) or not _is_utterance(e2):
-			raise NotImplementedError("Non-utterance Events are not supported yet")
-
-		if e1.agent != e2.agent and e1.payload and e2.payload:
-			result_X.append(preprocess_f(e1.payload))
-			result_y.append(preprocess_f(e2.payload))
-
-	return result_X, result_y
+	preprocess_f = lru_cache(maxsize=None)(preprocess_f) if preprocess_f else lambda x: x
+	events = episode.events
+	if len(events) > 1 and any(e.type is not _UTTERANCE for e in events):
+		raise NotImplementedError("Non-utterance Events are not supported yet")
+
+	pairs = [
+		(preprocess_f(e1.payload), preprocess_f(e2.payload))
+		for e1, e2 in zip(events, islice(events, 1, None))
+		if e1.agent != e2.agent and e1.payload and e2.payload
+	]
+	return [x for x, _ in pairs], [y for _, y in pairs]
 
 # Quick fix for circular dependencies
 from due.event import Event
+
+# Module-level aliases avoid Enum attribute lookups in per-event loops
+_UTTERANCE = Event.Type.Utterance
+_ACTION_VALUE = Event.Type.Action.value
@@ -19,12 +19,18 @@ import logging
 from due.action import Action
 from due.util.time import convert_datetime
 
+# Lightweight, immutable record with the same fields as an Event. Corpus loaders
+# use it for large amounts of recorded Events (see :meth:`Event.save`)
 EventTuple = namedtuple('EventTuple', ['type', 'timestamp', 'agent', 'payload'])
 
-class Event(EventTuple):
+class Event(object):
 	"""
 	An Event is anything that can happen in an Episode. It can be an Utterance,
 	an Action, or a Leave event.
+
+	Events have the same fields as an :data:`EventTuple`, and behave like one
+	when iterated, indexed or compared; they are stored in slots rather than
+	in a tuple, so that they can also be marked as acted.
 	"""
 
 	class Type(Enum):
@@ -34,23 +40,60 @@ class Event(EventTuple):
 		* `Event.Type.Utterance`
 		* `Event.Type.Leave`
 		* `Event.Type.Action`
+
+		Members are singletons, so types can be compared by identity
+		(`event.type is Event.Type.Utterance`). Values are the strings used
+		in saved Events.
 		"""
 		Utterance = "utterance"
 		Leave = "leave"
 		Action = "action"
 
-	def __init__(self, *args, **kwargs):
-		super().__init__()
-		# EventTuple.__init__(self, *args, **kwargs)
-		self._logger = logging.getLogger(__name__)
-		if not isinstance(self.timestamp, datetime):
-			raise ValueError('timestamp value is not a `datetime` instance: ' \
-							     'please update your code to avoid unexpected errors.')
-		if self.agent and not isinstance(self.agent, str):
-			raise ValueError('`agent` value is not a `str` object. Please provide a ' \
-				             'string ID to ensure correct serialization.')
+	# Fields most read when scanning Episodes come first
+	__slots__ = ('type', 'agent', 'payload', 'timestamp', 'acted')
+
+	_logger = logging.getLogger(__name__)
+
+	def __init__(self, type, timestamp, agent, payload):
+		self.type = type
+		self.agent = agent
+		self.payload = payload
+		self.timestamp = timestamp
+		# Developer checks, skipped when Python runs with -O
+		if __debug__:
+			if not isinstance(self.timestamp, datetime):
+				raise ValueError('timestamp value is not a `datetime` instance: ' \
+								     'please update your code to avoid unexpected errors.')
+			if self.agent and not isinstance(self.agent, str):
+				raise ValueError('`agent` value is not a `str` object. Please provide a ' \
+					             'string ID to ensure correct serialization.')
 		self.acted = None
 
+	def __iter__(self):
+		return iter((self.type, self.timestamp, self.agent, self.payload))
+
+	def __getitem__(self, index):
+		return (self.type, self.timestamp, self.agent, self.payload)[index]
+
+	def __len__(self):
+		return 4
+
+	def __eq__(self, other):
+		if isinstance(other, Event):
+			return self.type is other.type \
+				and self.agent == other.agent \
+				and self.payload == other.payload \
+				and self.timestamp == other.timestamp
+		if isinstance(other, tuple):
+			return tuple(self) == other
+		return NotImplemented
+
+	def __hash__(self):
+		return hash(tuple(self))
+
+	def __repr__(self):
+		return f"Event(type={self.type!r}, timestamp={self.timestamp!r}, agent={self.agent!r}, payload={self.payload!r})"
+
 	def mark_acted(self, timestamp=None):
 		"""
 		Mark the Event as acted storing the timestamp of the moment the event
@@ -70,14 +113,12 @@ class Event(EventTuple):
 		:return: a saved Event
 		:rtype: `list`
 		"""
-		result = self._replace(
-			type=self.type.value,
-			timestamp=self.timestamp.isoformat()
-		)
-		if self.type == Event.Type.Action:
-			result = result._replace(payload=self.payload.save())
-
-		return dict(result._asdict())
+		return {
+			'type': self.type.value,
+			'timestamp': self.timestamp.isoformat(),
+			'agent': self.agent,
+			'payload': self.payload.save() if self.type is Event.Type.Action else self.payload
+		}
 
 	@staticmethod
 	def load(saved):
@@ -102,4 +143,4 @@ class Event(EventTuple):
 		:return: a new Event object that is a clone of `self`
 		:rtype: :class:`due.event.Event`
 		"""
-		return Event(*list(self))
+		return Event(self.type, self.timestamp, self.agent, self.payload)
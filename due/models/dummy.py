@@ -1,18 +1,21 @@
 import logging
 
 from due.agent import Agent
-from due.episode import LiveEpisode
 from due.event import Event
 
+logger = logging.getLogger(__name__ + '.DummyAgent')
+
 class DummyAgent(Agent):
 	"""
 	A Dummy Agent is an Agent that simply logs new Episodes and Events,
 	expecting the interaction to be commanded externally.
 	"""
+
+	__slots__ = ('_active_episodes',)
+
 	def __init__(self, agent_id=None):
 		super().__init__(agent_id)
 		self._active_episodes = {}
-		self._logger = logging.getLogger(__name__ + '.DummyAgent')
 
 	def save(self):
 		"""See :meth:`due.agent.Agent.save`"""
@@ -29,18 +32,20 @@ class DummyAgent(Agent):
 
 	def new_episode_callback(self, new_episode):
 		"""See :meth:`due.agent.Agent.new_episode_callback`"""
-		self._logger.info("New episode callback: %s", str(new_episode))
+		logger.info("New episode callback: %s", new_episode)
 		self._active_episodes[new_episode.id] = new_episode
 
 	def utterance_callback(self, episode):
 		"""See :meth:`due.agent.Agent.utterance_callback`"""
-		self._logger.debug("Utterance received.")
+		logger.debug("Utterance received.")
 
 	def action_callback(self, episode):
 		"""See :meth:`due.agent.Agent.action_callback`"""
-		self._logger.debug("Action received.")
+		logger.debug("Action received.")
 
 	def leave_callback(self, episode):
 		"""See :meth:`due.agent.Agent.leave_callback`"""
-		agent = episode.last_event(Event.Type.Leave).agent
-		self._logger.debug("Agent %s left the episode.", agent)
+		if logger.isEnabledFor(logging.DEBUG):
+			agent = episode.last_event(Event.Type.Leave).agent
+			logger.debug("Agent %s left the episode.", agent)
+		self._active_episodes.pop(episode.id, None)
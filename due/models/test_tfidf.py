@@ -40,6 +40,34 @@ class TestTfIdfAgent(unittest.TestCase):
 		result = agent.utterance_callback(_get_test_episode())
 		self.assertEqual(result[0].payload, 'bbb')
 
+	def test_sklearn_analyzer(self):
+		agent = TfIdfAgent(parameters={'use_spacy': False})
+		agent.learn_episodes(_get_train_episodes())
+		self.assertEqual(agent._process_utterance('Aaa, BBB ccc!'), ['aaa', 'bbb', 'ccc'])
+		result = agent.utterance_callback(_get_test_episode())
+		self.assertEqual(result[0].payload, 'bbb')
+
+	def test_query_cache(self):
+		agent = TfIdfAgent()
+		agent.learn_episodes(_get_train_episodes())
+		self.assertEqual(agent.utterance_callback(_get_test_episode())[0].payload, 'bbb')
+		self.assertEqual(len(agent._query_answers), 1)
+		self.assertEqual(agent.utterance_callback(_get_test_episode())[0].payload, 'bbb')
+		self.assertEqual(len(agent._query_answers), 1)
+
+		agent.learn_episodes(_get_train_episodes())
+		self.assertEqual(len(agent._query_answers), 0)
+
+	def test_learn_incremental(self):
+		agent = TfIdfAgent()
+		agent.learn_episodes(_get_train_episodes())
+		agent.learn_episodes([])
+		agent.learn_episodes([_sample_episode()[0]])
+
+		agent_batch = TfIdfAgent()
+		agent_batch.learn_episodes(_get_train_episodes() + [_sample_episode()[0]])
+		self.assertEqual((agent._vectorized_past_utterances != agent_batch._vectorized_past_utterances).nnz, 0)
+
 	def test_tfidf_agent(self):
 		cb = TfIdfAgent()
 
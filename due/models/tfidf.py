@@ -3,23 +3,32 @@ Baseline sentence matching model based on If-Idf vector similarity.
 """
 import logging
 from datetime import datetime
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer, TfidfVectorizer
 from tqdm import tqdm
 
 import due
 from due.agent import Agent
 from due.event import Event
 from due.episode import Episode, extract_utterances
-from due.nlp.preprocessing import normalize_sentence
+from due.nlp.preprocessing import normalize_sentence, normalize_sentences
+
+logger = logging.getLogger(__name__ + '.TfIdfAgent')
+
+QUERY_CACHE_SIZE = 1024
 
 DEFAULT_PARAMETERS = {
 	'lemmatize_tokens': False,
+	'use_spacy': True,
+	'n_process': 1,
 }
 
+# sklearn's default word analyzer: lowercasing and a compiled token regex
+_SKLEARN_ANALYZER = TfidfVectorizer().build_analyzer()
+
 _UtteranceMetadata = namedtuple('_UtteranceMetadata', ['episode', 'index'])
 
 class TfIdfAgent(Agent):
@@ -31,9 +40,15 @@ class TfIdfAgent(Agent):
 	Utterance similarity is modeled as the plain **cosine distance** of the
 	**tf-idf** sentence vectors.
 
-	The only parameter that can be currently passed to the model is
-	`lemmatize_tokens` (defaults to `False`), which adds lemmatization to
-	learned utterances.
+	The following parameters can be passed to the model:
+
+	* `lemmatize_tokens` (defaults to `False`): adds lemmatization to learned
+	  utterances
+	* `use_spacy` (defaults to `True`): normalize utterances with spaCy. When
+	  `False`, sklearn's default regex analyzer is used instead, which is much
+	  faster but ignores `lemmatize_tokens`
+	* `n_process` (defaults to `1`): number of processes spaCy uses to normalize
+	  learned utterances (`-1` for all CPUs)
 
 	:param parameters: A dictionary of parameters.
 	:param parameters: `dict`
@@ -41,48 +56,95 @@ class TfIdfAgent(Agent):
 	:param _data: `dict`
 	"""
 
+	__slots__ = (
+		'parameters',
+		'_vectorizer',
+		'_tfidf_transformer',
+		'_past_utterance_counts',
+		'_past_episodes',
+		'_normalized_past_utterances',
+		'_vectorized_past_utterances',
+		'_past_utterances_metadata',
+		'_past_utterances_answers',
+		'_query_answers',
+	)
+
 	def __init__(self, id=None, parameters=None, _data=None):
 		parameters = parameters if parameters else {}
-		self._logger = logging.getLogger(__name__ + ".TfIdfAgent")
 		super().__init__(id)
 		self.parameters = {**DEFAULT_PARAMETERS, **parameters} if not _data else {**_data['parameters'], **parameters}
-		self._active_episodes = {}
-		self._vectorizer = TfidfVectorizer(tokenizer=_dummy_function, preprocessor=_dummy_function)
+		# Hashed term counts are stateless, so learning new utterances never re-counts past ones
+		self._vectorizer = HashingVectorizer(tokenizer=_dummy_function, preprocessor=_dummy_function, alternate_sign=False, norm=None, dtype=np.float32)
+		self._tfidf_transformer = TfidfTransformer()
 
 		self._past_episodes = []
 		self._normalized_past_utterances = [] # Sequence of all the utterances in the episodes
+		self._past_utterance_counts = None    # Hashed term counts of the utterances, kept to refit the idf weights
 		self._vectorized_past_utterances = []
 		self._past_utterances_metadata = []   # Per each utterance, remember source episode and position
+		self._past_utterances_answers = []    # Per each utterance, the payload of the event that follows it
+		self._query_answers = OrderedDict()   # LRU cache of predicted answers, reset at every fit
 
 		if _data:
-			self.parameters = _data['parameters']
+			self.parameters = {**DEFAULT_PARAMETERS, **_data['parameters']}
 			self._past_episodes = [Episode.load(e) for e in _data['past_episodes']]
 			if self._past_episodes:
 				self._normalized_past_utterances = _data['normalized_past_utterances']
+				self._past_utterance_counts = self._vectorizer.transform(self._normalized_past_utterances)
 				self._past_utterances_metadata = self._load_past_utterances_metadata(_data['past_utterances_metadata'], self._past_episodes)
-				self._vectorized_past_utterances = self._vectorizer.fit_transform(self._normalized_past_utterances)
+				self._past_utterances_answers = [_answer_payload(m) for m in self._past_utterances_metadata]
+				self._fit()
 
 	def learn_episodes(self, episodes):
 		"""See :meth:`due.agent.Agent.learn_episodes`"""
+		new_utterances = []
 		for e in tqdm(episodes):
 			self._past_episodes.append(e)
 			for i, u in enumerate(extract_utterances(e)):
 				if u:
-					self._normalized_past_utterances.append(self._process_utterance(u))
-					self._past_utterances_metadata.append(_UtteranceMetadata(e, i))
-		self._vectorized_past_utterances = self._vectorizer.fit_transform(self._normalized_past_utterances)
-
+					new_utterances.append(u)
+					metadata = _UtteranceMetadata(e, i)
+					self._past_utterances_metadata.append(metadata)
+					self._past_utterances_answers.append(_answer_payload(metadata))
+
+		new_normalized_utterances = self._process_utterances(new_utterances)
+		self._normalized_past_utterances.extend(new_normalized_utterances)
+		if new_normalized_utterances:
+			new_counts = self._vectorizer.transform(new_normalized_utterances)
+			if self._past_utterance_counts is None:
+				self._past_utterance_counts = new_counts
+			else:
+				self._past_utterance_counts = sp.vstack([self._past_utterance_counts, new_counts], format='csr')
+			self._fit()
+
+	def _fit(self):
+		# Only the idf weights are refit: the count matrix is kept next to the
+		# tf-idf one for this, roughly doubling the memory of learned utterances
+		self._vectorized_past_utterances = self._tfidf_transformer.fit_transform(self._past_utterance_counts)
+		self._query_answers.clear()
 
 	def _process_utterance(self, utterance):
+		if not self.parameters['use_spacy']:
+			return _SKLEARN_ANALYZER(utterance)
 		return normalize_sentence(
 			utterance,
 			return_tokens=True,
 			lemmatize=self.parameters['lemmatize_tokens']
 		)
 
+	def _process_utterances(self, utterances):
+		if not self.parameters['use_spacy']:
+			return [_SKLEARN_ANALYZER(u) for u in utterances]
+		return normalize_sentences(
+			utterances,
+			return_tokens=True,
+			lemmatize=self.parameters['lemmatize_tokens'],
+			n_process=self.parameters['n_process']
+		)
+
 	def action_callback(self, action):
 		"""See :meth:`due.agent.Agent.action_callback`"""
-		self._logger.debug("Received action: %s", action)
+		logger.debug("Received action: %s", action)
 
 	def utterance_callback(self, episode):
 		"""See :meth:`due.agent.Agent.utterance_callback`"""
@@ -94,19 +156,26 @@ class TfIdfAgent(Agent):
 
 
 	def _predict(self, sentence):
-		sentence_v = self._vectorizer.transform([self._process_utterance(sentence)])
-		scores = cosine_similarity(self._vectorized_past_utterances, sentence_v)
-		max_utterance_meta = self._past_utterances_metadata[np.argmax(scores)]
-		matched_past_episode = max_utterance_meta.episode
-		matched_index_in_episode = max_utterance_meta.index
 		try:
-			return matched_past_episode.events[matched_index_in_episode+1].payload
-		except IndexError:
-			return None
+			result = self._query_answers[sentence]
+		except KeyError:
+			result = self._match(sentence)
+			self._query_answers[sentence] = result
+			if len(self._query_answers) > QUERY_CACHE_SIZE:
+				self._query_answers.popitem(last=False)
+		else:
+			self._query_answers.move_to_end(sentence)
+		return result
+
+	def _match(self, sentence):
+		sentence_v = self._tfidf_transformer.transform(self._vectorizer.transform([self._process_utterance(sentence)]))
+		# Tf-idf rows are L2-normalized, so a single sparse dot product gives cosine similarities
+		scores = (self._vectorized_past_utterances @ sentence_v.T).toarray().ravel()
+		return self._past_utterances_answers[np.argmax(scores)]
 
 	def new_episode_callback(self, new_episode):
 		"""See :meth:`due.agent.Agent.new_episode_callback`"""
-		self._logger.debug("New episode callback received: %s", new_episode)
+		logger.debug("New episode callback received: %s", new_episode)
 
 	def leave_callback(self, episode):
 		"""See :meth:`due.agent.Agent.leave_callback`"""
@@ -141,6 +210,13 @@ class TfIdfAgent(Agent):
 			if self._past_episodes[i] is episode:
 				return i
 
+def _answer_payload(utterance_metadata):
+	"""Return the payload of the event following the given utterance, if any"""
+	try:
+		return utterance_metadata.episode.events[utterance_metadata.index+1].payload
+	except IndexError:
+		return None
+
 def _dummy_function(x):
 	"""This is used to feed already processed data to TfidfVectorizer"""
 	return x
@@ -36,6 +36,30 @@ def batches(X, y, batch_size):
 		end_index = start_index + batch_size
 		yield X[start_index:end_index], y[start_index:end_index]
 
+def bucketed_batches(X, y, batch_size):
+	"""
+	Same as :func:`batches`, but `X` sentences (and their `y` counterparts) are
+	first sorted by number of words, so that each batch groups sentences of
+	similar length. Once batches are converted to matrices (see
+	:func:`batch_to_matrix`) this means much less padding to compute on.
+
+	Sorting is stable: sentences of the same length keep their relative order.
+
+	>>> list(bucketed_batches(['a b c', 'a', 'a b', 'b'], [0, 1, 2, 3], 2))
+	[(['a', 'b'], [1, 3]), (['a b', 'a b c'], [2, 0])]
+
+	:param X: a sequence of sentences
+	:type X: `list` of `str`
+	:param y: a sequence of elements
+	:type y: `list`
+	:param batch_size: number of elements in each batch
+	:type batch_size: `int`
+	:return: a generator of the list of batches
+	:rtype: `list` of (`list`, `list`)
+	"""
+	order = sorted(range(len(X)), key=lambda i: len(X[i].split()))
+	yield from batches([X[i] for i in order], [y[i] for i in order], batch_size)
+
 def pad_sequence(sequence, pad_value, final_length):
 	"""
 	Trim the sequence if longer than final_length, pad it with pad_value if shorter.
@@ -88,21 +112,27 @@ def batch_to_matrix(batch, vocabulary, max_words=None):
 	:return: a matrix representing the batch
 	:rtype: :class:`np.array`
 	"""
-	sentence_indexes = [[vocabulary.index(w) for w in sentence.split()] for sentence in batch]
+	index = vocabulary.index
+	eos_index = index(EOS)
+	sentence_indexes = [[index(w) for w in sentence.split()] for sentence in batch]
 	max_length = max([len(x) for x in sentence_indexes])
 	if max_words:
 		max_length = min(max_length, max_words)
-	sentence_indexes = [pad_sequence(s, vocabulary.index(EOS), max_length+1) for s in sentence_indexes]
+	sentence_indexes = [pad_sequence(s, eos_index, max_length+1) for s in sentence_indexes]
 
 	result = np.transpose(sentence_indexes)
 	result = np.expand_dims(result, axis=2)
 	return result
 
-def batch_to_tensor(batch, vocabulary, max_words=None, device=None):
+def batch_to_tensor(batch, vocabulary, max_words=None, device=None, pin_memory=False):
 	"""
 	Same as :func:`batch_to_matrix`, but returns a Torch tensor, optionally
 	mapped to `device`.
 
+	When copying to a CUDA device, `pin_memory` allocates the tensor in
+	page-locked host memory first, so that the copy is issued asynchronously
+	and can overlap with computation on the device.
+
 	:param batch: a list of sentence
 	:type batch: `list` of `str`
 	:param vocabulary: a Vocabulary to look up word indexes
@@ -111,8 +141,12 @@ def batch_to_tensor(batch, vocabulary, max_words=None, device=None):
 	:type max_words: `int`
 	:param device: a Torch device to map the tensor to (eg. `torch.device("cuda")`)
 	:type device: :class:`torch.device`
+	:param pin_memory: copy to `device` asynchronously, from pinned memory (requires CUDA)
+	:type pin_memory: `bool`
 	:return: a Torch tensor that is equivalent to the output of :func:`batch_to_matrix`
 	:rtype: :class:`torch.tensor`
 	"""
-	result_matrix = batch_to_matrix(batch, vocabulary, max_words)
-	return torch.from_numpy(result_matrix, dtype=torch.long).to(device)
+	result = torch.from_numpy(batch_to_matrix(batch, vocabulary, max_words)).long()
+	if pin_memory:
+		result = result.pin_memory()
+	return result.to(device, non_blocking=pin_memory)
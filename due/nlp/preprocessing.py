@@ -3,21 +3,20 @@ from functools import lru_cache
 
 import spacy
 
+TOKENIZE_CACHE_SIZE = 50000
+
 def tokenize_sentence(sentence, language, lemmatize):
 	"""
 	Wraps around Spacy's tokenizer returning a list of string tokens for the
-	given sentence.
+	given sentence. Results are memoized, as the same sentences tend to be
+	tokenized over and over (eg. frequent user queries).
 
 	:param sentence: a sentence
 	:type sentence: `str`
 	:param language: An ISO 639-1 language code ('en', 'it', ...)
 	:type language: `str`
 	"""
-	s_spacy = _load_spacy(language)(sentence)
-	if lemmatize:
-		return [str(token.lemma) for token in s_spacy]
-	else:
-		return [str(token) for token in s_spacy]
+	return list(_tokenize_cached(sentence, language, lemmatize))
 
 def normalize_sentence(sentence, return_tokens=False, language='en', lemmatize=False):
 	"""
@@ -39,13 +38,51 @@ def normalize_sentence(sentence, return_tokens=False, language='en', lemmatize=F
 	:return: a normalized sentence
 	:rtype: `str` or (`list` of `str`)
 	"""
-	result = sentence.lower()
-	result = re.sub(r'\s+', ' ', result)
+	result = _prepare_sentence(sentence)
 	result = tokenize_sentence(result, language, lemmatize)
 	if not return_tokens:
 		result = ' '.join(result)
 	return result
 
+def normalize_sentences(sentences, return_tokens=False, language='en', lemmatize=False, n_process=1):
+	"""
+	Same as :func:`normalize_sentence`, but normalize a sequence of sentences
+	in one go. Sentences are streamed through Spacy's pipeline, which is
+	faster than tokenizing them one by one, and sentences that only differ by
+	case or whitespace are tokenized once.
+
+	:param sentences: a sequence of sentences
+	:type sentences: `list` of `str`
+	:param return_tokens: whether to return lists of `str` tokens or whole strings
+	:type return_tokens: `bool`
+	:param language: An ISO 639-1 language code ('en', 'it', ...)
+	:type language: `str`
+	:param n_process: number of processes Spacy's pipeline is run on (-1 for all CPUs)
+	:type n_process: `int`
+	:return: the normalized sentences, in the same order
+	:rtype: `list` of `str` or (`list` of `str`)
+	"""
+	prepared = [_prepare_sentence(s) for s in sentences]
+	unique = list(dict.fromkeys(prepared))
+	tokens = dict(zip(unique, (_spacy_tokens(s_spacy, lemmatize) for s_spacy in _load_spacy(language).pipe(unique, n_process=n_process))))
+	result = [list(tokens[s]) for s in prepared]
+	if not return_tokens:
+		result = [' '.join(tokens) for tokens in result]
+	return result
+
+def _prepare_sentence(sentence):
+	return re.sub(r'\s+', ' ', sentence.lower())
+
+def _spacy_tokens(s_spacy, lemmatize):
+	if lemmatize:
+		return [str(token.lemma) for token in s_spacy]
+	else:
+		return [str(token) for token in s_spacy]
+
+@lru_cache(TOKENIZE_CACHE_SIZE)
+def _tokenize_cached(sentence, language, lemmatize):
+	return tuple(_spacy_tokens(_load_spacy(language)(sentence), lemmatize))
+
 @lru_cache(8)
 def _load_spacy(language):
 	return spacy.load(language)
@@ -1,8 +1,9 @@
 import unittest
+import importlib.util
 
 from numpy.testing import assert_array_equal
 
-from due.nlp.batches import batches, batch_to_matrix, batch_to_tensor, pad_sequence
+from due.nlp.batches import batches, bucketed_batches, batch_to_matrix, batch_to_tensor, pad_sequence
 from due.nlp.vocabulary import Vocabulary, EOS, UNK
 
 class TestBatches(unittest.TestCase):
@@ -20,7 +21,17 @@ class TestBatches(unittest.TestCase):
 		self.assertEqual(result, [
 			([0, 1, 2, 3], ['a', 'b', 'c', 'd']),
 			([4, 5], ['e', 'f']),
-		])  
+		])
+
+	def test_bucketed_batches(self):
+		X = ['a b c', 'a', 'a b c d', 'a b', 'b']
+		y = [3, 1, 4, 2, 1]
+		result = list(bucketed_batches(X, y, 2))
+		self.assertEqual(result, [
+			(['a', 'b'], [1, 1]),
+			(['a b', 'a b c'], [2, 3]),
+			(['a b c d'], [4]),
+		])
 
 
 class TestPadSequence(unittest.TestCase):
@@ -95,3 +106,16 @@ class TestBatchToMatrix(unittest.TestCase):
 			[[self.EOS], [self.bbb], [self.ccc]],
 			[[self.EOS], [self.EOS], [self.EOS]],
 		])
+
+@unittest.skipUnless(importlib.util.find_spec('torch'), "torch is not installed")
+class TestBatchToTensor(unittest.TestCase):
+
+	def test_batch_to_tensor(self):
+		import torch
+		v = Vocabulary()
+		v.add_word('aaa')
+		v.add_word('bbb')
+		batch = ['aaa bbb', 'bbb']
+		t = batch_to_tensor(batch, v)
+		self.assertEqual(t.dtype, torch.long)
+		assert_array_equal(t.numpy(), batch_to_matrix(batch, v))
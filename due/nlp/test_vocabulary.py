@@ -20,6 +20,18 @@ class TestVocabulary(unittest.TestCase):
 		self.assertEqual(v.word(foo_index), 'foo')
 		self.assertEqual(v.word(bar_expected_index), 'bar')
 
+	def test_vocabulary_from_sentences(self):
+		X = ['foo bar', 'bar baz']
+		y = ['baz bar', 'foo']
+		v = vocabulary_from_sentences(X + y)
+
+		self.assertEqual(v.size(), Vocabulary().size()+3)
+		self.assertEqual(v.index('bar'), v.index('foo')+1)
+		self.assertEqual(v.index('baz'), v.index('foo')+2)
+		self.assertEqual(v.index_to_count[v.index('foo')], 2)
+		self.assertEqual(v.index_to_count[v.index('bar')], 3)
+		self.assertEqual(v.index_to_count[v.index('baz')], 2)
+
 	def test_unknown_words(self):
 		v = Vocabulary()
 		v.add_word('foo')
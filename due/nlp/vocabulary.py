@@ -6,7 +6,7 @@ API
 ===
 """
 
-from collections import defaultdict
+from collections import defaultdict, Counter
 
 import numpy as np
 from six import iteritems
@@ -40,12 +40,14 @@ class Vocabulary():
 		self.add_word(SOS) # Start of String
 		self.add_word(EOS) # End of String
 
-	def add_word(self, word):
+	def add_word(self, word, count=1):
 		"""
 		Add a new word to the dictionary.
 
 		:param word: the word to add
 		:type word: `str`
+		:param count: number of occurrences of the word to record
+		:type count: `int`
 		"""
 		if word in self.word_to_index:
 			index = self.word_to_index[word]
@@ -55,7 +57,7 @@ class Vocabulary():
 			self.word_to_index[word] = index
 			self.index_to_word[index] = word
 
-		self.index_to_count[index] += 1
+		self.index_to_count[index] += count
 
 	def index(self, word):
 		"""
@@ -115,6 +117,27 @@ class Vocabulary():
 		result.current_index = data['current_index']
 		return result
 
+def vocabulary_from_sentences(sentences):
+	"""
+	Build a Vocabulary out of a sequence of whitespace-tokenized sentences,
+	counting every occurrence of each word. Words are indexed in order of
+	first appearance.
+
+	>>> v = vocabulary_from_sentences(['hello there', 'hello'])
+	>>> v.index_to_count[v.index('hello')]
+	2
+
+	:param sentences: an iterable of sentences
+	:type sentences: iterable of `str`
+	:return: a Vocabulary of the words in `sentences`
+	:rtype: :class:`Vocabulary`
+	"""
+	counts = Counter(word for sentence in sentences for word in sentence.split())
+	result = Vocabulary()
+	for word, count in iteritems(counts):
+		result.add_word(word, count)
+	return result
+
 def prune_vocabulary(vocabulary, min_occurrences):
 	"""
 	Return a copy of the given vocabulary where words with less than
@@ -28,11 +28,13 @@ class ConsoleLiveEpisode(AsyncLiveEpisode):
 		super().__init__(live_episode.starter, live_episode.invited)
 		self.agents_noecho = [a.id for a in agents_noecho] if agents_noecho else []
 
-	def add_event(self, event):
-		if event.agent not in self.agents_noecho:
-			print_formatted_text(HTML(f'<agent>{event.agent} ></agent> {event.payload}'), style=style)
+	def add_events(self, events):
+		events = list(events)
+		for e in events:
+			if e.agent not in self.agents_noecho:
+				print_formatted_text(HTML(f'<agent>{e.agent} ></agent> {e.payload}'), style=style)
 
-		super().add_event(event)
+		super().add_events(events)
 
 def serve(agent):
 	"""
@@ -96,9 +96,9 @@ class DueBot(ClientXMPP, Agent):
 
 	def act_events(self, events, episode):
 		for e in events:
-			if e.type == Event.Type.Action:
+			if e.type is Event.Type.Action:
 				e.payload.run()
-			elif e.type == Event.Type.Utterance:
+			elif e.type is Event.Type.Utterance:
 				if self._last_message is None:
 					self._logger.warning("Could not send message '%s' because \
 						no last message is set. This is not supposed to happen.", e.payload)
@@ -1,4 +1,5 @@
 import unittest
+import asyncio
 
 from datetime import datetime
 import tempfile
@@ -54,6 +55,21 @@ class TestAgent(unittest.TestCase):
 		self.assertTrue(e.events[-1].payload is action)
 
 
+	def test_agent_episode_async(self):
+		e = self.alice.start_episode(self.bob)
+
+		action = RecordedAction()
+		events = [Event(Event.Type.Utterance, datetime.now(), self.alice.id, "alice1"),
+		          Event(Event.Type.Action, datetime.now(), self.alice.id, action)]
+		asyncio.run(self.alice.act_events_async(events, e))
+		self.assertTrue(action.done)
+		self.assertEqual(len(e.events), 2)
+		self.assertEqual(e.events[0].payload, 'alice1')
+		self.assertTrue(e.events[1].payload is action)
+
+		result = asyncio.run(self.bob.event_callback_async(e.events[0], e))
+		self.assertEqual(result, [])
+
 	def test_agent_episode_deprecated(self):
 		e = self.alice.start_episode(self.bob)
 		self.assertEqual(len(e.events), 0)
@@ -78,6 +94,22 @@ class TestAgent(unittest.TestCase):
 
 		self.alice.leave(e)
 
+	def test_agent_episode_timestamp(self):
+		e = self.alice.start_episode(self.bob)
+		t = datetime(2019, 12, 28, 12, 0)
+
+		self.alice.say('alice1', e, timestamp=t)
+		self.alice.do(RecordedAction(), e, timestamp=t)
+		self.alice.leave(e, timestamp=t)
+		self.assertEqual([event.timestamp for event in e.events], [t, t, t])
+
+	def test_leave_releases_episode(self):
+		e = self.alice.start_episode(self.bob)
+		self.assertIs(self.bob._active_episodes[e.id], e)
+
+		self.alice.leave(e)
+		self.assertNotIn(e.id, self.bob._active_episodes)
+
 	def test_human_agent_load_save(self):
 		test_dir = tempfile.mkdtemp()
 		test_path = os.path.join(test_dir, 'test_human_agent_load_save.pkl')
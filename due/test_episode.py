@@ -1,10 +1,11 @@
 import unittest
+import asyncio
 import tempfile
 import os
 
 from due.persistence import serialize, deserialize
 from due.models.dummy import DummyAgent
-from due.event import Event
+from due.event import Event, EventTuple
 from due.action import RecordedAction
 from due.episode import *
 
@@ -17,14 +18,22 @@ class RecordCallbackAgent(DummyAgent):
 		self.recorded_utterances = 0
 		self.recorded_actions = 0
 		self.recorded_leave = 0
+		self.recorded_episode_lengths = []
 
 	def utterance_callback(self, episode):
 		self.recorded_utterances += 1
+		self.recorded_episode_lengths.append(len(episode.events))
 	def action_callback(self, episode):
 		self.recorded_actions += 1
 	def leave_callback(self, episode):
 		self.recorded_leave += 1
 
+class EchoAgent(DummyAgent):
+
+	def utterance_callback(self, episode):
+		utterance = episode.last_event(Event.Type.Utterance)
+		return [Event(Event.Type.Utterance, datetime.now(), self.id, 're:' + utterance.payload)]
+
 class TestEpisode(unittest.TestCase):
 
 	def test_add_event(self):
@@ -78,6 +87,76 @@ class TestEpisode(unittest.TestCase):
 		self.assertEqual(bob.recorded_actions, 1)
 		self.assertEqual(bob.recorded_leave, 1)
 
+	def test_add_events(self):
+		alice = DummyAgent('Alice')
+		bob = RecordCallbackAgent('Bob')
+		episode = alice.start_episode(bob)
+
+		utterance1 = Event(Event.Type.Utterance, datetime.now(), alice.id, 'First utterance')
+		utterance2 = Event(Event.Type.Utterance, datetime.now(), alice.id, 'Second utterance')
+		episode.add_events([utterance1, utterance2])
+		self.assertEqual(episode.events, [utterance1, utterance2])
+		self.assertIsNotNone(utterance1.acted)
+		self.assertIsNotNone(utterance2.acted)
+		self.assertEqual(bob.recorded_utterances, 2)
+		self.assertEqual(bob.recorded_episode_lengths, [1, 2])
+
+	def test_add_events_responses(self):
+		alice = DummyAgent('Alice')
+		bob = EchoAgent('Bob')
+		episode = alice.start_episode(bob)
+
+		utterance1 = Event(Event.Type.Utterance, datetime.now(), alice.id, 'hi')
+		utterance2 = Event(Event.Type.Utterance, datetime.now(), alice.id, 'how are you?')
+		alice.act_events([utterance1, utterance2], episode)
+		self.assertEqual([e.payload for e in episode.events], ['hi', 're:hi', 'how are you?', 're:how are you?'])
+
+	def test_add_events_max_responses(self):
+		alice = EchoAgent('Alice')
+		bob = EchoAgent('Bob')
+		episode = alice.start_episode(bob)
+
+		utterance1 = Event(Event.Type.Utterance, datetime.now(), alice.id, 'hi')
+		utterance2 = Event(Event.Type.Utterance, datetime.now(), alice.id, 'bye')
+		with self.assertLogs('due.episode', level='WARNING'):
+			episode.add_events([utterance1, utterance2])
+		self.assertEqual(len(episode.events), 2*(MAX_EVENT_RESPONSES + 2))
+		self.assertEqual(episode.events[MAX_EVENT_RESPONSES + 2], utterance2)
+
+	def test_add_events_override(self):
+		added = []
+		class RecordingLiveEpisode(LiveEpisode):
+			def add_events(self, events):
+				events = list(events)
+				added.extend(events)
+				super().add_events(events)
+
+		alice = DummyAgent('Alice')
+		bob = RecordCallbackAgent('Bob')
+		episode = RecordingLiveEpisode(alice, bob)
+		utterance1 = Event(Event.Type.Utterance, datetime.now(), alice.id, 'First utterance')
+		utterance2 = Event(Event.Type.Utterance, datetime.now(), alice.id, 'Second utterance')
+		episode.add_event(utterance1)
+		alice.act_events([utterance2], episode)
+		self.assertEqual(added, [utterance1, utterance2])
+		self.assertEqual(episode.events, [utterance1, utterance2])
+
+	def test_async_add_event(self):
+		alice = DummyAgent('Alice')
+		bob = RecordCallbackAgent('Bob')
+
+		async def say_and_wait():
+			episode = AsyncLiveEpisode(alice, bob)
+			alice.say('First utterance', episode)
+			alice.say('Second utterance', episode)
+			pending = asyncio.all_tasks() - {asyncio.current_task()}
+			await asyncio.gather(*pending)
+			return episode
+
+		episode = asyncio.run(say_and_wait())
+		self.assertEqual([e.payload for e in episode.events], ['First utterance', 'Second utterance'])
+		self.assertEqual(bob.recorded_utterances, 2)
+
 	def test_last_event(self):
 		alice = DummyAgent('Alice')
 		bob = DummyAgent('Bob')
@@ -150,6 +229,54 @@ class TestEpisode(unittest.TestCase):
 		assert Episode.load(saved_episode) == episode
 		assert Episode.load(saved_episode) == Episode.load(saved_episode_compact)
 
+	def test_episode_save_load_compact_special_characters(self):
+		episode = Episode('Alice', 'Bob')
+		episode.events = [
+			Event(Event.Type.Utterance, datetime.now(), 'Alice', 'a "quoted" | piped\nutterance'),
+			Event(Event.Type.Utterance, datetime.now(), 'Bob', '42'),
+			Event(Event.Type.Leave, datetime.now(), 'Bob', None),
+		]
+
+		saved_episode_compact = episode.save(output_format='compact')
+		self.assertEqual(len(saved_episode_compact['events']), 3)
+		self.assertEqual(Episode.load(saved_episode_compact), episode)
+
+	def test_episode_load_compact_lenient(self):
+		saved_episode_compact = {
+			'id': 1,
+			'starter_agent': 'alice',
+			'invited_agents': ['bob'],
+			'timestamp': '2019-12-27T00:00:00',
+			'events': ['utterance|5s|alice|hey | there', 'leave|0s|alice'],
+			'format': 'compact'
+		}
+		episode = Episode.load(saved_episode_compact)
+		self.assertEqual(episode.events[0].payload, 'hey | there')
+		self.assertEqual(episode.events[1].timestamp, datetime(2019, 12, 27, 0, 0, 5))
+		self.assertIsNone(episode.events[1].payload)
+
+	def test_episode_load_compact_timestamp_whitespace(self):
+		saved_episode_compact = {
+			'id': 1,
+			'starter_agent': 'alice',
+			'invited_agents': ['bob'],
+			'timestamp': '2019-12-27T00:00:00',
+			'events': ['utterance|5s |alice|hey', 'utterance| 10 |alice|there'],
+			'format': 'compact'
+		}
+		episode = Episode.load(saved_episode_compact)
+		self.assertEqual(episode.events[0].timestamp, datetime(2019, 12, 27, 0, 0, 5))
+		self.assertEqual(episode.events[1].timestamp, datetime(2019, 12, 27, 0, 0, 15))
+
+	def test_episode_save_load_event_tuples(self):
+		episode = Episode('Alice', 'Bob')
+		utterance1 = EventTuple(Event.Type.Utterance, datetime.now(), 'Alice', 'First utterance')
+		utterance2 = EventTuple(Event.Type.Utterance, datetime.now(), 'Bob', 'Second utterance')
+		episode.events = [utterance1, utterance2]
+
+		loaded_e = Episode.load(episode.save())
+		self.assertEqual(loaded_e.events, [Event(*utterance1), Event(*utterance2)])
+
 	def test_equals_true(self):
 		e1 = Episode('a', 'b')
 		e1.events = [
@@ -170,6 +297,9 @@ class TestEpisode(unittest.TestCase):
 		]
 
 		assert e1 == e2
+		assert not e1 != e2
+		assert hash(e1) == hash(e2)
+		assert e1 != 'not an episode'
 
 	def test_equals_timestamp(self):
 		e1 = Episode('a', 'b')
@@ -0,0 +1,16 @@
+import unittest
+
+import due
+
+class TestLazyAttributes(unittest.TestCase):
+
+	def test_lazy_attribute(self):
+		from due.agent import Agent
+		self.assertIs(due.Agent, Agent)
+
+	def test_dir_no_duplicates(self):
+		due.Agent
+		names = dir(due)
+		self.assertIn('Agent', names)
+		self.assertIn('Event', names)
+		self.assertEqual(len(names), len(set(names)))
@@ -3,7 +3,10 @@ import tempfile
 
 import pytest
 
+import due.persistence
 from due.persistence import serialize, deserialize
+from due.models.dummy import DummyAgent
+from due.episode import Episode
 
 TEST_OBJECT = {
     'a': 1,
@@ -34,6 +37,18 @@ class TestPersistence(object):
             serialize(TEST_OBJECT, path, file_format='json')
             assert deserialize(path) == TEST_OBJECT
 
+    def test_json_episode_orjson(self):
+        pytest.importorskip('orjson')
+        _assert_json_episode_round_trip()
+
+    def test_json_episode_stdlib(self, monkeypatch):
+        monkeypatch.setattr(due.persistence, 'orjson', None)
+        _assert_json_episode_round_trip()
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'saved.json')
+            serialize(TEST_OBJECT, path, file_format='json')
+            assert deserialize(path) == TEST_OBJECT
+
     def test_pickle(self):
         with tempfile.TemporaryDirectory() as d:
             path = os.path.join(d, 'saved.pickle')
@@ -46,3 +61,14 @@ class TestPersistence(object):
             serialize(TEST_OBJECT, path, file_format='pickle')
             with pytest.raises(ValueError):
                 deserialize(path)
+
+def _assert_json_episode_round_trip():
+    alice = DummyAgent('alice')
+    bob = DummyAgent('bob')
+    episode = alice.start_episode(bob)
+    alice.say("Hi!", episode)
+    bob.say("Hello", episode)
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, 'saved.json')
+        serialize(episode.save(), path, file_format='json')
+        assert Episode.load(deserialize(path)) == episode
@@ -1,6 +1,9 @@
 """
 This module contains helper functions related to the Python language.
 """
+import sys
+from functools import lru_cache
+from importlib import import_module
 
 def full_class_name(a_class):
 	"""
@@ -33,6 +36,27 @@ def dynamic_import(name):
 		result = getattr(result, c)
 	return result
 
+@lru_cache(maxsize=None)
+def cached_dynamic_import(name):
+	"""
+	Same as :func:`dynamic_import`, but `name` must be in the `module.attribute`
+	form, and results are cached. The module is imported if needed, so this is
+	safe to call before the module is loaded. Use this for names that are
+	resolved repeatedly, such as the classes of saved objects.
+
+	>>> cached_dynamic_import('due.action.RecordedAction')
+	<class 'due.action.RecordedAction'>
+
+	:param name: the fully qualified name of a module attribute
+	:type name: `str`
+	:return: the imported entity
+	:rtype: *many*
+	"""
+	module_name, _, attribute = name.rpartition('.')
+	if module_name not in sys.modules:
+		import_module(module_name)
+	return getattr(sys.modules[module_name], attribute)
+
 def is_notebook():
 	"""
 	Detect whether `due` is running in a Jupyter Notebook. This is needed
@@ -8,8 +8,8 @@ from io import TextIOWrapper
 from zipfile import ZipFile
 from collections import namedtuple
 
-import yaml
-from magic import Magic
+# `yaml` and `magic` are imported where they are used: `import due` registers
+# the precompiled resource index and does not need either of them
 
 DEFAULT_RESOURCE_FOLDER = '~/.due/resources'
 
@@ -74,9 +74,21 @@ class ResourceManager(object):
 		:param path: pointer to the YAML file
 		:type path: `file object`
 		"""
-		resource_list = yaml.load(yaml_stream, Loader=yaml.FullLoader)['resources']
+		import yaml
+		# Use the libyaml-backed loader when PyYAML was built with it
+		loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+		self.register_index(yaml.load(yaml_stream, Loader=loader))
 
-		for r in resource_list:
+	def register_index(self, index):
+		"""
+		Register every resource in an already parsed index of resources. `index`
+		must have the same structure as the YAML files read by :meth:`register_yaml`,
+		that is a `dict` with a `resources` key holding a list of resource objects.
+
+		:param index: an index of resources
+		:type index: `dict`
+		"""
+		for r in index['resources']:
 			self.register_resource(r['name'], r['description'], r['url'], r['filename'])
 
 	def open_resource(self, name, mode="r"):
@@ -108,6 +120,7 @@ class ResourceManager(object):
 		self._error_if_not_found(name)
 
 		path = self.resource_path(name)
+		from magic import Magic
 		magic = Magic(mime=True)
 		mime = magic.from_file(path)
 		if mime != 'application/zip':
@@ -1,3 +1,4 @@
+import os
 import unittest
 
 from due.util.python import *
@@ -11,4 +12,10 @@ class TestUtil(unittest.TestCase):
 	def test_dynamic_import(self):
 		from due.agent import Agent
 		DynamicallyImportedAgent = dynamic_import('due.agent.Agent')
-		self.assertEqual(DynamicallyImportedAgent, Agent)
\ No newline at end of file
+		self.assertEqual(DynamicallyImportedAgent, Agent)
+
+	def test_cached_dynamic_import(self):
+		from due.action import RecordedAction
+		self.assertIs(cached_dynamic_import('due.action.RecordedAction'), RecordedAction)
+		self.assertIs(cached_dynamic_import('due.action.RecordedAction'), RecordedAction)
+		self.assertIs(cached_dynamic_import('os.path'), os.path)
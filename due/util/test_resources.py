@@ -3,6 +3,12 @@ import os
 import tempfile
 import shutil
 from io import StringIO
+try:
+	import importlib_resources
+except ImportError:
+	import importlib.resources as importlib_resources
+
+import yaml
 
 from due.util.resources import *
 
@@ -44,6 +50,23 @@ class TestResourceManager(unittest.TestCase):
 				'second_fake_resource': ResourceRecord('second_fake_resource', 'another fake resource', 'http://www.other-fake-address.com/fake-resource.zip', 'second-fake-resource.zip'),
 			})
 
+	def test_register_index(self):
+		with tempfile.TemporaryDirectory() as tmp_dir:
+			rm_yaml = ResourceManager(resource_folder=tmp_dir)
+			rm_yaml.register_yaml(StringIO(TEST_YAML))
+
+			rm_index = ResourceManager(resource_folder=tmp_dir)
+			rm_index.register_index(yaml.safe_load(TEST_YAML))
+
+			self.assertEqual(rm_index.resources, rm_yaml.resources)
+			self.assertEqual(rm_index.resource_filenames, rm_yaml.resource_filenames)
+
+	def test_precompiled_index_matches_yaml(self):
+		import due
+		from due._resource_index import DATA
+		with importlib_resources.files(due).joinpath('resource_index.yaml').open('rb') as f:
+			self.assertEqual(DATA, yaml.safe_load(f))
+
 	def test_open_resource(self):
 		with tempfile.TemporaryDirectory() as tmp_dir:
 			content = "this is the file content"
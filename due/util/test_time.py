@@ -11,6 +11,10 @@ class TestConvertDatetime(object):
         dt = "2019-12-28T22:18:41.817246"
         assert convert_datetime(dt) == datetime(2019, 12, 28, 22, 18, 41, 817246)
 
+    def test_datetime_str_non_iso(self):
+        dt = "Dec 28 2019 22:18:41"
+        assert convert_datetime(dt) == datetime(2019, 12, 28, 22, 18, 41)
+
 class TestParseTimedelta(object):
     def test_seconds_int(self):
         delta = 124
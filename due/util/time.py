@@ -1,16 +1,22 @@
 """
 Helpers to deal with timestamps
 """
-# from dateutil.parser import parse as dateutil_parse
 import re
+from functools import lru_cache
 from datetime import datetime, timedelta
 
 TIMEDELTA_PATTERN = r"(?=\d+[dhms])(?:(\d+)d)?(?:(\d+)h)?(?:(\d+)m)?(?:(\d+)s)?"
+TIMESTAMP_CACHE_SIZE = 4096
 
 def convert_datetime(timestamp):
     """
     Convert object to datetime, if needed.
 
+    Strings are parsed with the fast :meth:`datetime.datetime.fromisoformat`,
+    which covers everything :meth:`datetime.datetime.isoformat` writes; other
+    formats fall back to the much slower `dateutil` parser. Parsed strings are
+    cached, as timestamps tend to repeat across the events of a corpus.
+
     :param timestamp: A timestamp
     :type timestamp: `datetime` or `str`
     :return: A `datetime` object
@@ -19,7 +25,15 @@ def convert_datetime(timestamp):
     if isinstance(timestamp, datetime):
         return timestamp
 
-    return datetime.fromisoformat(timestamp)
+    return _parse_datetime(timestamp)
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def _parse_datetime(timestamp):
+    try:
+        return datetime.fromisoformat(timestamp)
+    except ValueError:
+        from dateutil.parser import parse as dateutil_parse
+        return dateutil_parse(timestamp)
 
 def parse_timedelta(delta):
     """